@@ -18,11 +18,14 @@
 # IMPORTS
 # ============================================================================
 
+import functools
 import os
 import pathlib
 
 from deepspyce.io import raw_to_df, read_iar
 
+import numpy as np
+
 import pandas as pd
 
 # ============================================================================
@@ -31,44 +34,54 @@ import pandas as pd
 
 PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__)))
 
+_RAW_1M = PATH / "20201027_133329_1m.raw"
+
+_RAW_TEST = PATH / "20201027_133329_test.raw"
+
+_CSV_TEST = PATH / "20201027_133329_test.csv"
+
+_IAR = PATH / "J0437-4715_1_A1.iar"
+
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=4)
+def _cached_raw_df(path: pathlib.Path) -> pd.DataFrame:
+    """Read a template raw data file once, as dataframe."""
+    return raw_to_df(path)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_raw_bytes(path: pathlib.Path) -> bytes:
+    """Read a template raw data file once, as bytes."""
+    return path.read_bytes()
+
+
 def load_raw_1m(ret_df: bool = True):
     """Load template raw data file."""
-    path = PATH / "20201027_133329_1m.raw"
-
     if ret_df:
-        return raw_to_df(path)
-    else:
-        with open(path, "rb") as file:
-            raw = file.read()
-        return raw
+        return _cached_raw_df(_RAW_1M).copy()
+
+    return _cached_raw_bytes(_RAW_1M)
 
 
 def load_raw_test(ret_df: bool = True):
     """Load template raw_test data file."""
-    path = PATH / "20201027_133329_test.raw"
-
     if ret_df:
-        return raw_to_df(path)
-    else:
-        with open(path, "rb") as file:
-            raw_test = file.read()
-        return raw_test
+        return _cached_raw_df(_RAW_TEST).copy()
+
+    return _cached_raw_bytes(_RAW_TEST)
 
 
 def load_csv_test() -> pd.DataFrame:
     """Load template csv_test data file."""
-    path = PATH / "20201027_133329_test.csv"
+    csv = pd.read_csv(_CSV_TEST, dtype=np.int64, header=None, engine="c")
 
-    return pd.read_csv(path, dtype=">i8", header=None)
+    return csv.astype(">i8")
 
 
 def load_iar() -> dict:
     """Load template .iar file."""
-    path = PATH / "J0437-4715_1_A1.iar"
-
-    return read_iar(path)
+    return read_iar(_IAR)
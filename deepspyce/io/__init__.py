@@ -22,6 +22,11 @@ from .filterbank import (  # noqa
     iar_to_fil_header,  # noqa
     raw_to_filterbank,  # noqa
 )  # noqa
-from .fits import df_to_fits, make_fits_header, raw_to_fits  # noqa
+from .fits import (  # noqa
+    df_to_fits,  # noqa
+    fits_to_df,  # noqa
+    make_fits_header,  # noqa
+    raw_to_fits,  # noqa
+)  # noqa
 from .iar import read_iar  # noqa
-from .raw import raw_to_df  # noqa
+from .raw import df_to_raw, iter_raw, raw_to_df, raws_to_dfs  # noqa
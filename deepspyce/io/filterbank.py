@@ -20,14 +20,14 @@
 
 import os
 import struct
-from datetime import datetime
+import time
 
-from deepspyce.utils.auxiliar import data_to_bytes, deepwarn
+from deepspyce.utils.auxiliar import data_to_buffer, deepwarn
 from deepspyce.utils.files_utils import (
     get_file_attr,
     is_filelike,
     read_file,
-    write_to_file,
+    write_chunks_to_file,
 )
 
 import numpy as np
@@ -36,6 +36,34 @@ import pandas as pd
 
 from .iar import read_iar
 
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+_UINT = struct.Struct("I")
+
+_LONG = struct.Struct("<l")
+
+_DOUBLE = struct.Struct("<d")
+
+_START_END_KEYS = frozenset(("HEADER_START", "HEADER_END"))
+
+# ---- ROACH ----
+# values
+_ROACH_FFT_PTS = 128
+_ROACH_ADC_CLK = 200e6
+#  parameters
+_ROACH_TSAMP = _ROACH_FFT_PTS / _ROACH_ADC_CLK
+_ROACH_FOFF = _ROACH_ADC_CLK / _ROACH_FFT_PTS * 1e-6
+
+_IAR_INT_KEYS = (
+    "Telescope ID",
+    "Machine ID",
+    "Data Type",
+    "Average Data",
+    "Sub Bands",
+)
+
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
@@ -49,24 +77,16 @@ def _iardict_to_fil_header(iardict: dict) -> dict:
     # ref_dm = iardict["Reference DM"]
     # pul_period = iardict["Pulsar Period"]
     # high_freq = iardict["Highest Observation Frequency (MHz)"]
-    telescope_id = int(iardict["Telescope ID"])
-    machine_id = int(iardict["Machine ID"])
-    data_type = int(iardict["Data Type"])
     # observing_time = int(iardict["Observing Time (minutes)"])
     # gain = iardict["Gain (dB)"]
     # bandwidth = int(iardict["Total Bandwith (MHz)"])
-    avg_data = int(iardict["Average Data"])
-    sub_bands = int(iardict["Sub Bands"])
+    telescope_id, machine_id, data_type, avg_data, sub_bands = [
+        int(iardict[key]) for key in _IAR_INT_KEYS
+    ]
 
-    # ---- ROACH ----
-    # values
-    fft_pts = 128
-    adc_clk = 200e6
-    #  parameters
-    tsamp = avg_data * fft_pts / adc_clk
-    f_off = adc_clk / fft_pts * 1e-6
+    tsamp = avg_data * _ROACH_TSAMP
 
-    time_now = datetime.now().strftime("_%Y%m%d_%H%M%S")
+    time_now = time.strftime("_%Y%m%d_%H%M%S")
 
     # tsamp = 1e6 / float(bandwidth) * avg_data
     rawdatafile = f"ds{avg_data}_{source_name}{time_now}.fil"
@@ -84,7 +104,7 @@ def _iardict_to_fil_header(iardict: dict) -> dict:
         "tstart": 0.0,
         "tsamp": tsamp,
         "fch1": 0.0,
-        "foff": f_off,
+        "foff": _ROACH_FOFF,
         "nchans": sub_bands,
         "nifs": 1,
         "ibeam": 1,
@@ -92,35 +112,33 @@ def _iardict_to_fil_header(iardict: dict) -> dict:
     }
 
 
-def _check_key_pos(
-    header: dict, key: str, pos: int, verb: bool = False
-) -> bool:
-    keys = list(header.keys())
-    loc = keys.index(key) if key in keys else None
-    if loc == pos:
-        return True
-    if loc is None:
-        if verb:
-            deepwarn(f"{key} is missing in the header.")
+def _check_key_pos(header: dict, key: str, pos: int, errs: list) -> bool:
+    if key not in header:
+        errs.append(f"{key} is missing in the header.")
         return None
-    if verb:
-        deepwarn(f"{key} is not in the {pos} header key.")
+    if pos == 0:
+        in_pos = next(iter(header)) == key
+    elif pos == len(header) - 1:
+        in_pos = next(reversed(header)) == key
+    else:
+        in_pos = list(header).index(key) == pos
+    if not in_pos:
+        errs.append(f"{key} is not in the {pos} header key.")
+        return False
+    if header[key] is not None:
+        errs.append(f"header['{key}'] should be None!")
+        return False
 
-    return False
+    return True
 
 
 def check_header_start_end(header: dict, verb: bool = False) -> tuple:
     """Check the HEADER_START and HEADER_END entries of the header."""
-    start = _check_key_pos(header, "HEADER_START", 0, verb)
-    end = _check_key_pos(header, "HEADER_END", len(header) - 1, verb)
-    if start and (header["HEADER_START"] is not None):
-        if verb:
-            deepwarn("header['HEADER_START'] should be None!")
-        start = False
-    if end and (header["HEADER_END"] is not None):
-        if verb:
-            deepwarn("header['HEADER_END'] should be None!")
-        end = False
+    errs = []
+    start = _check_key_pos(header, "HEADER_START", 0, errs)
+    end = _check_key_pos(header, "HEADER_END", len(header) - 1, errs)
+    if verb and errs:
+        deepwarn("\n".join(errs))
     if (start and end) and verb:
         print("HEADER_START and HEADER END are OK!.")
 
@@ -133,32 +151,30 @@ def fixed_header_start_end(header: dict, check: bool = True) -> dict:
         start, end = check_header_start_end(header, False)
         if start and end:
             return header
-    hs = "HEADER_START"
-    he = "HEADER_END"
-    fixedheader = dict({hs: None})
-    for key, value in header.items():
-        if key not in [hs, he]:
-            fixedheader[key] = value
-    fixedheader[he] = None
+    body = {k: v for k, v in header.items() if k not in _START_END_KEYS}
 
-    return fixedheader
+    return {"HEADER_START": None, **body, "HEADER_END": None}
 
 
 def _encode_header(hedicc: dict) -> bytes:
 
-    bina = b""
+    bina = bytearray()
     for key, value in hedicc.items():
-        ret = struct.pack("I", len(key)) + key.encode()
-        if value is not None:
-            if isinstance(value, str):
-                ret = ret + struct.pack("I", len(value)) + value.encode()
-            elif isinstance(value, int):
-                ret = ret + struct.pack("<l", value)
-            else:
-                ret = ret + struct.pack("<d", value)
-        bina = bina + ret
+        bkey = key.encode()
+        bina += _UINT.pack(len(bkey))
+        bina += bkey
+        if value is None:
+            continue
+        if isinstance(value, str):
+            bvalue = value.encode()
+            bina += _UINT.pack(len(bvalue))
+            bina += bvalue
+        elif isinstance(value, int):
+            bina += _LONG.pack(value)
+        else:
+            bina += _DOUBLE.pack(value)
 
-    return bina
+    return bytes(bina)
 
 
 def iar_to_fil_header(iar, encode: bool = False) -> bytes:
@@ -179,7 +195,7 @@ def _binraw_to_filterbank(
     outfile: os.PathLike = None,
     overwrite: bool = False,
 ) -> None:
-    """Generate .fil file from header dict and raw file."""
+    """Generate .fil file from header dict and raw data (any buffer)."""
     if headerdict is None:
         headerdict = dict()
     if not isinstance(headerdict, dict):
@@ -188,23 +204,21 @@ def _binraw_to_filterbank(
     if outfile is None:
         if name is None:
             raise OSError("Could not resolve/infer output file name.")
+        outfile = name
+    elif name is not None:
+        if is_filelike(outfile):
+            filen = get_file_attr(outfile, "name")
         else:
-            outfile = name
-            filen = outfile
-    elif is_filelike(outfile):
-        filen = get_file_attr(outfile, "name")
-    else:
-        filen = os.path.basename(outfile)
-    if filen != name:
-        deepwarn(
-            f"\nFile name: '{filen}' and "
-            + f"\nrawdatafile: '{name}' in header "
-            + "\ndo not match."
-        )
+            filen = os.path.basename(outfile)
+        if filen != name:
+            deepwarn(
+                f"\nFile name: '{filen}' and"
+                f"\nrawdatafile: '{name}' in header"
+                "\ndo not match."
+            )
     headerdict = fixed_header_start_end(headerdict)
     bin_header = _encode_header(headerdict)
-    write_to_file(outfile, bin_header, "wb", overwrite)
-    write_to_file(outfile, bin_raw, "ab")
+    write_chunks_to_file(outfile, [bin_header, bin_raw], "wb", overwrite)
 
     return
 
@@ -231,7 +245,7 @@ def df_to_filterbank(
     order: str = "F",
 ) -> None:
     """Generate .fil file from dataframe and header dict."""
-    bin_raw = data_to_bytes(df, fmt, order)
+    bin_raw = data_to_buffer(df, fmt, order)
     _binraw_to_filterbank(bin_raw, header, outfile, overwrite)
 
     return
@@ -20,9 +20,7 @@
 
 import os
 from datetime import datetime
-
-from astropy.io import fits
-from astropy.table import Table
+from typing import TYPE_CHECKING
 
 from deepspyce.io.raw import raw_to_df
 
@@ -30,6 +28,38 @@ import numpy as np
 
 import pandas as pd
 
+if TYPE_CHECKING:  # astropy is imported on demand, it is slow to import
+    from astropy.io import fits
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Sample: TREG_091209.cal.acs.txt [Single Dish FITS (SDFITS)]
+FITS_HEADER_TEMPLATE = (
+    ("SIMPLE", "T", "/ conforms to FITS standard"),
+    ("BITPIX", 8, "/ BITS/PIXEL"),
+    ("NAXIS", 0, "/ number of array dimensions"),
+    ("EXTEND", "T", "/File contains extensions"),
+    ("DATE", "", "/"),
+    ("ORIGIN", "IAR", "/ origin of observation"),
+    ("TELESCOP", "Antena del IAR", "/ the telescope used"),
+    ("OBSERVAT", "IAR", "/ the observatory"),
+    ("GUIDEVER", "DeepSpyce ver1.0", "/ this file was created by DeepSpyce"),
+    ("FITSVER", "1.6", "/ FITS definition version"),
+)
+
+FITS_FORMATS = {
+    "b1": "L",
+    "u1": "B",
+    "i2": "I",
+    "i4": "J",
+    "i8": "K",
+    "f4": "E",
+    "f8": "D",
+    "c8": "C",
+    "c16": "M",
+}
 
 # ============================================================================
 # FUNCTIONS
@@ -38,44 +68,60 @@ import pandas as pd
 
 def make_fits_header(
     header: dict = None, template: bool = False
-) -> fits.Header:
+) -> "fits.Header":
     """Create a header if desired."""
+    from astropy.io import fits
+
     if header is None:
         header = dict()
     if not isinstance(header, fits.Header):
         header = fits.Header(header)
     if template:
-        # Sample: TREG_091209.cal.acs.txt [Single Dish FITS (SDFITS)]
-        header["SIMPLE"] = ("T", "/ conforms to FITS standard")
-        header["BITPIX"] = (8, "/ BITS/PIXEL")
-        header["NAXIS"] = (0, "/ number of array dimensions")
-        header["EXTEND"] = ("T", "/File contains extensions")
+        header.extend(FITS_HEADER_TEMPLATE, strip=False, update=True)
         header["DATE"] = (datetime.today().strftime("%y-%m-%d"), "/")
-        header["ORIGIN"] = ("IAR", "/ origin of observation")
-        header["TELESCOP"] = ("Antena del IAR", "/ the telescope used")
-        header["OBSERVAT"] = ("IAR", "/ the observatory")
-        header["GUIDEVER"] = (
-            "DeepSpyce ver1.0",
-            "/ this file was created by DeepSpyce",
-        )
-        header["FITSVER"] = ("1.6", "/ FITS definition version")
 
     return header
 
 
+def _array_to_bintable(
+    data: np.ndarray, header: "fits.Header", name: str
+) -> "fits.BinTableHDU":
+    """Build a binary table HDU straight from the columns of an array."""
+    from astropy.io import fits
+    from astropy.table import Table
+
+    header = header.copy()
+    code = FITS_FORMATS.get(f"{data.dtype.kind}{data.dtype.itemsize}")
+    if code is None or data.ndim != 2:
+        return fits.BinTableHDU(Table(data), header=header, name=name)
+    cols = [
+        fits.Column(name=f"col{idx}", format=code, array=data[:, idx])
+        for idx in range(data.shape[1])
+    ]
+
+    return fits.BinTableHDU.from_columns(cols, header=header, name=name)
+
+
 def df_to_fits(
     df: pd.DataFrame,
     outfile: os.PathLike,
     overwrite: bool = False,
-    header: bool = None,
+    header: dict = None,
+    output_verify: str = "exception",
 ) -> None:
     """Create .fits from dataframe or ndarray."""
+    from astropy.io import fits
+
     hdr = make_fits_header(header)
     primary_hdu = fits.PrimaryHDU(header=hdr)
-    tab = Table(np.asarray(df))
-    bintable_hdu = fits.BinTableHDU(tab, header=hdr, name="SINGLE DISH")
+    bintable_hdu = _array_to_bintable(np.asarray(df), hdr, "SINGLE DISH")
     hdul = fits.HDUList([primary_hdu, bintable_hdu])
-    hdul.writeto(outfile, overwrite=overwrite)
+    hdul.writeto(
+        outfile,
+        overwrite=overwrite,
+        output_verify=output_verify,
+        checksum=False,
+    )
 
     return
 
@@ -84,13 +130,29 @@ def raw_to_fits(
     rawfile: os.PathLike,
     outfile: os.PathLike,
     overwrite: bool = False,
-    header: bool = None,
+    header: dict = None,
     n_channels: int = 2048,
     fmt: np.dtype = ">i8",
     order: str = "F",
+    output_verify: str = "exception",
 ) -> None:
     """Create .fits from .raw file."""
     data = raw_to_df(rawfile, n_channels, fmt, order)
-    df_to_fits(data, outfile, overwrite, header)
+    df_to_fits(data, outfile, overwrite, header, output_verify)
 
     return
+
+
+def fits_to_df(
+    fitsfile: os.PathLike, columns: list = None, hdu: str = "SINGLE DISH"
+) -> pd.DataFrame:
+    """Read (some columns of) a .fits binary table into a dataframe."""
+    from astropy.io import fits
+
+    with fits.open(fitsfile, memmap=True, lazy_load_hdus=True) as hdul:
+        table = hdul[hdu].data
+        if columns is None:
+            columns = table.columns.names
+        data = {name: np.array(table.field(name)) for name in columns}
+
+    return pd.DataFrame(data)
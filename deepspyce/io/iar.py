@@ -18,23 +18,52 @@
 # IMPORTS
 # =============================================================================
 
+import functools
 import os
 
 from deepspyce.utils.files_utils import read_file
 
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Values are floats, unless overridden here.
+IAR_HEADER_TYPES = {
+    "Source Name": str,
+}
+
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
 
 
+def _iar_value(key: str, value: str):
+    """Cast an .iar value to its overridden type, or float."""
+    try:
+        return IAR_HEADER_TYPES.get(key, float)(value)
+    except ValueError:
+        return value
+
+
+def _parse_iar(text: str) -> dict:
+    """Parse the text of an .iar file into dict."""
+    pairs = (line.split(",", 1) for line in text.splitlines() if line)
+
+    return {key: _iar_value(key, value) for key, value in pairs}
+
+
+@functools.lru_cache(maxsize=64)
+def _read_iar_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Read an .iar file once per modification time and size."""
+    return _parse_iar(read_file(path, "r"))
+
+
 def read_iar(iarfile: os.PathLike) -> dict:
     """Read .iar file into dict."""
-    iar = read_file(iarfile, "r")
-    iar = dict([line.split(",") for line in iar.splitlines()])
-    for key, value in iar.items():
-        try:
-            iar[key] = float(value)
-        except ValueError:
-            continue
-
-    return iar
+    if isinstance(iarfile, (str, os.PathLike)):
+        path = os.path.abspath(iarfile)
+        stat = os.stat(path)
+        cached = _read_iar_cached(path, stat.st_mtime_ns, stat.st_size)
+        return dict(cached)
+
+    return _parse_iar(read_file(iarfile, "r"))
@@ -18,9 +18,19 @@
 # IMPORTS
 # =============================================================================
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from deepspyce.utils.files_utils import read_file
+from deepspyce.utils.auxiliar import aligned_empty, data_to_buffer, deepwarn
+from deepspyce.utils.files_utils import (
+    advise_sequential,
+    is_readable,
+    is_seekable,
+    open_file,
+    read_file,
+    write_to_file,
+)
 
 import numpy as np
 
@@ -31,19 +41,156 @@ import pandas as pd
 # ============================================================================
 
 
+def _count_records(nbytes: int, n_channels: int, dt: np.dtype) -> int:
+    """Count the whole records in a raw data size, warning on leftovers."""
+    n_records, extra = divmod(nbytes, n_channels * dt.itemsize)
+    if extra:
+        deepwarn(
+            f"Raw data has {extra} trailing bytes that do not fill a "
+            f"record of {n_channels} channels; they are ignored."
+        )
+
+    return n_records
+
+
+def _memmap_raw(
+    rawfile: os.PathLike, n_channels: int, dt: np.dtype, order: str
+) -> np.ndarray:
+    """Map a binary raw data file into a copy-on-write array."""
+    n_records = _count_records(os.path.getsize(rawfile), n_channels, dt)
+    if n_records == 0:
+        return np.empty((n_channels, 0), dtype=dt, order=order)
+
+    return np.memmap(
+        rawfile,
+        dtype=dt,
+        mode="c",
+        shape=(n_channels, n_records),
+        order=order,
+    )
+
+
+def _readinto_full(stream: io.IOBase, view: memoryview) -> int:
+    """Fill a buffer from a stream, until it is full or the data ends."""
+    nread = 0
+    while nread < len(view):
+        chunk = stream.readinto(view[nread:])
+        if not chunk:
+            break
+        nread += chunk
+
+    return nread
+
+
+def _readinto_raw(
+    stream: io.IOBase, n_channels: int, dt: np.dtype, order: str
+) -> np.ndarray:
+    """Read a binary raw data stream into a preallocated array."""
+    advise_sequential(stream)
+    pos = stream.tell()
+    nbytes = stream.seek(0, io.SEEK_END) - pos
+    n_records = _count_records(nbytes, n_channels, dt)
+    stream.seek(pos)
+    np_data = aligned_empty(n_channels * n_records, dt)
+    view = memoryview(np_data).cast("B")
+    if _readinto_full(stream, view) < len(view):
+        raise OSError(f"Unexpected end of data in {stream}")
+
+    return np_data.reshape(n_channels, n_records, order=order)
+
+
 def raw_to_df(
     rawfile: os.PathLike,
     n_channels: int = 2048,
     fmt: np.dtype = ">i8",
     order: str = "F",
+    mmap: bool = False,
 ) -> pd.DataFrame:
-    """Read a binary raw data file, and returns a dataframe."""
-    bin_raw = read_file(rawfile, "rb")
+    """Read a binary raw data file, and returns a dataframe.
+
+    With ``mmap=True`` a path is memory mapped, and the dataframe stays
+    backed by the file: do not truncate or rewrite it while in use.
+    """
     dt = np.dtype(fmt)
-    np_data = np.frombuffer(bin_raw, dtype=dt)
-    bytes_per_data = dt.alignment
-    total_bytes = len(bin_raw)
-    n_records = int(total_bytes / n_channels / bytes_per_data)
+    if isinstance(rawfile, (str, os.PathLike)):
+        if mmap:
+            np_data = _memmap_raw(rawfile, n_channels, dt, order)
+            return pd.DataFrame(np_data, copy=False)
+        with open_file(rawfile, "rb") as buff:
+            np_data = _readinto_raw(buff, n_channels, dt, order)
+        return pd.DataFrame(np_data, copy=False)
+    if hasattr(rawfile, "readinto") and is_seekable(rawfile):
+        np_data = _readinto_raw(rawfile, n_channels, dt, order)
+        return pd.DataFrame(np_data, copy=False)
+    bin_raw = read_file(rawfile, "rb")
+    n_records = _count_records(len(bin_raw), n_channels, dt)
+    np_data = np.frombuffer(bin_raw, dtype=dt, count=n_channels * n_records)
     np_data = np_data.reshape(n_channels, n_records, order=order)
 
     return pd.DataFrame(np_data)
+
+
+def raws_to_dfs(
+    rawfiles: list,
+    n_channels: int = 2048,
+    fmt: np.dtype = ">i8",
+    order: str = "F",
+    max_workers: int = None,
+) -> list:
+    """Read several binary raw data files concurrently, into dataframes."""
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(
+            executor.map(
+                lambda rawfile: raw_to_df(rawfile, n_channels, fmt, order),
+                rawfiles,
+            )
+        )
+
+
+def df_to_raw(
+    df: pd.DataFrame,
+    outfile: os.PathLike,
+    overwrite: bool = False,
+    fmt: np.dtype = ">i8",
+    order: str = "F",
+) -> None:
+    """Write a dataframe or ndarray into a binary raw data file."""
+    write_to_file(outfile, data_to_buffer(df, fmt, order), "wb", overwrite)
+
+    return
+
+
+def iter_raw(
+    rawfile: os.PathLike,
+    n_channels: int = 2048,
+    fmt: np.dtype = ">i8",
+    chunk_records: int = 1024,
+    order: str = "F",
+):
+    """Iterate over a binary raw data file, in chunks of records.
+
+    Records are expected one after another, so only Fortran order is
+    supported: in C order each channel spans the whole file. Each chunk
+    is an array of shape (n_channels, <= chunk_records). The same buffer
+    is reused between iterations, so copy a chunk to keep it.
+    """
+    if order != "F":
+        raise ValueError(f"Can not iterate raw data in order {order!r}.")
+    if isinstance(rawfile, (str, os.PathLike)):
+        with open_file(rawfile, "rb") as buff:
+            yield from iter_raw(buff, n_channels, fmt, chunk_records, order)
+        return
+    if not hasattr(rawfile, "readinto") or not is_readable(rawfile):
+        raise OSError(f"Could not read {rawfile}")
+    advise_sequential(rawfile)
+    dt = np.dtype(fmt)
+    np_data = aligned_empty(n_channels * chunk_records, dt)
+    view = memoryview(np_data).cast("B")
+    while True:
+        nread = _readinto_full(rawfile, view)
+        n_records = _count_records(nread, n_channels, dt)
+        if n_records:
+            chunk = np_data[: n_channels * n_records]
+            yield chunk.reshape(n_channels, n_records, order=order)
+        if nread < len(view):
+            return
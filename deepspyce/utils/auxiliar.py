@@ -28,12 +28,34 @@ import numpy as np
 
 
 def data_to_bytes(
-    data=np.ndarray, fmt: np.dtype = ">i8", order: str = "F"
+    data: np.ndarray, fmt: np.dtype = ">i8", order: str = "F"
 ) -> bytes:
     """Convert common data array to bytes."""
     return np.asarray(data, dtype=np.dtype(fmt)).tobytes(order)
 
 
+def data_to_buffer(
+    data: np.ndarray, fmt: np.dtype = ">i8", order: str = "F"
+) -> memoryview:
+    """Expose common data array as a flat buffer, without a bytes copy."""
+    flat = np.asarray(data, dtype=np.dtype(fmt)).ravel(order)
+
+    return memoryview(flat).cast("B")
+
+
+def aligned_empty(
+    size: int, fmt: np.dtype = ">i8", align: int = 64
+) -> np.ndarray:
+    """Create an uninitialized 1D array, aligned to ``align`` bytes."""
+    dt = np.dtype(fmt)
+    nbytes = size * dt.itemsize
+    buff = np.empty(nbytes + align, dtype=np.uint8)
+    start = -buff.ctypes.data % align
+    end = start + nbytes
+
+    return buff[start:end].view(dt)
+
+
 def deepwarn(message):
     """Generate a warning."""
     warnings.warn(message, stacklevel=2)
@@ -33,6 +33,8 @@ wmodes = ["w", "wb", "w+", "wb+", "r+"]
 
 amodes = ["a", "ab", "a+", "ab+"]
 
+BUFFER_SIZE = 1 << 20
+
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
@@ -44,13 +46,24 @@ def file_exists(path_str: os.PathLike):
 
 
 def open_file(
-    path_str: os.PathLike, mode: str = "r", overwrite: bool = False
+    path_str: os.PathLike,
+    mode: str = "r",
+    overwrite: bool = False,
+    buffering: int = -1,
 ) -> io.IOBase:
     """Open a file."""
-    if (mode in wmodes) and (not overwrite) and file_exists(path_str):
-        raise FileExistsError("File will not be overwritten.")
+    if (mode in wmodes) and (not overwrite):
+        try:
+            if "w" in mode:
+                return open(path_str, mode.replace("w", "x"), buffering)
+            if file_exists(path_str):
+                raise FileExistsError(path_str)
+        except FileExistsError as err:
+            # Devices and FIFOs (e.g. /dev/null) may still be written.
+            if file_exists(path_str):
+                raise FileExistsError("File will not be overwritten.") from err
 
-    return open(path_str, mode)
+    return open(path_str, mode, buffering)
 
 
 def is_filelike(fileobj: io.FileIO) -> bool:
@@ -102,6 +115,27 @@ def is_readable(fileobj: io.FileIO) -> bool:
     return call_file_method(fileobj, "readable")
 
 
+def is_seekable(fileobj: io.FileIO) -> bool:
+    """Check if a filelike object is seekable."""
+    return call_file_method(fileobj, "seekable")
+
+
+def advise_sequential(fileobj: io.FileIO) -> None:
+    """Hint the OS that a file will be read sequentially, if supported."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = fileobj.fileno()
+    except (AttributeError, OSError):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        return
+
+    return
+
+
 def close_file(fileobj: io.FileIO):
     """Close a file."""
     return call_file_method(fileobj, "close")
@@ -128,12 +162,27 @@ def write_to_file(
     """Write data into a file."""
     if data is None:
         return
+    write_chunks_to_file(path_or_stream, [data], mode, overwrite)
+
+    return
+
+
+def write_chunks_to_file(
+    path_or_stream: os.PathLike,
+    chunks: list,
+    mode: str = "wb",
+    overwrite: bool = False,
+) -> None:
+    """Write several data chunks into a file, through a single handle."""
     if isinstance(path_or_stream, (str, os.PathLike)):
-        with open_file(path_or_stream, mode, overwrite) as buff:
-            buff.write(data)
+        buffering = BUFFER_SIZE if "b" in mode else -1
+        with open_file(path_or_stream, mode, overwrite, buffering) as buff:
+            for data in chunks:
+                buff.write(data)
         return
     if is_writable(path_or_stream):
-        path_or_stream.write(data)
+        for data in chunks:
+            path_or_stream.write(data)
         return
 
     raise OSError(f"Could not write data into {path_or_stream}")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   DeepSpyce Project (https://github.com/suaraujo/DeepSpyce).
+# Copyright (c) 2020, Susana Beatriz Araujo Furlan
+# License: MIT
+#   Full Text: https://github.com/suaraujo/DeepSpyce/blob/master/LICENSE
+
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+from deepspyce.utils.auxiliar import aligned_empty
+
+import numpy as np
+
+import pytest
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("fmt", [">i8", "<i4", "u1", ">c16"])
+@pytest.mark.parametrize("size", [1, 7, 2048, 100_003])
+@pytest.mark.parametrize("align", [16, 64, 4096])
+def test_aligned_empty(fmt: str, size: int, align: int):
+    arr = aligned_empty(size, fmt, align)
+
+    assert arr.ctypes.data % align == 0
+    assert arr.shape == (size,)
+    assert arr.dtype == np.dtype(fmt)
@@ -74,6 +74,16 @@ def test_load_raw_1m_df():
     np.testing.assert_almost_equal(result.iloc[2047].mean(), 0.0, 5)
 
 
+def test_load_raw_df_cached_copy():
+    """Test for getting independent copies of the cached raw_test file."""
+    first = datasets.load_raw_test()
+    first.iloc[0, 0] = -1
+    second = datasets.load_raw_test()
+
+    assert first is not second
+    assert second.iloc[0, 0] != -1
+
+
 def test_load_iar():
     """Test for opening test iar file."""
     result = datasets.load_iar()
@@ -12,10 +12,12 @@
 # IMPORTS
 # ============================================================================
 
+import os
 import warnings
 
 from deepspyce import datasets
 from deepspyce.utils.files_utils import (
+    advise_sequential,
     call_file_method,
     close_file,
     file_exists,
@@ -23,9 +25,11 @@ from deepspyce.utils.files_utils import (
     is_filelike,
     is_opened,
     is_readable,
+    is_seekable,
     is_writable,
     open_file,
     read_file,
+    write_chunks_to_file,
     write_to_file,
 )
 
@@ -84,6 +88,40 @@ def test_open_file_no_overwrite():
         open_file(rawpath, mode="w", overwrite=False)
 
 
+@pytest.mark.parametrize("mode", ["w", "wb", "w+", "wb+"])
+def test_open_file_new(tmp_path, mode: str):
+    path = tmp_path / "new.bin"
+    with open_file(path, mode=mode) as f:
+
+        assert f.writable()
+    with pytest.raises(FileExistsError):
+        open_file(path, mode=mode)
+    with open_file(path, mode=mode, overwrite=True) as f:
+
+        assert f.writable()
+
+
+@pytest.mark.skipif(not os.path.exists(os.devnull), reason="no devnull")
+def test_open_file_devnull():
+    with open_file(os.devnull, mode="wb") as f:
+        f.write(b"\x00")
+
+        assert f.writable()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="no fifo support")
+def test_open_file_fifo(tmp_path):
+    path = tmp_path / "fifo"
+    os.mkfifo(path)
+    rfd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        with open_file(path, mode="wb") as f:
+            f.write(b"\x00\x01")
+        assert os.read(rfd, 2) == b"\x00\x01"
+    finally:
+        os.close(rfd)
+
+
 def test_is_filelike(stream: callable):
     path = stream()
 
@@ -165,6 +203,25 @@ def test_is_writable():
         assert is_writable(f)
 
 
+def test_is_seekable(stream: callable):
+    path = stream()
+
+    assert is_seekable(path)
+    with open_file(iarpath, mode="r") as f:
+
+        assert is_seekable(f)
+
+
+def test_advise_sequential_pipe():
+    rfd, wfd = os.pipe()
+    with os.fdopen(rfd, "rb") as rf:
+        with os.fdopen(wfd, "wb") as wf:
+            wf.write(b"\x00\x01")
+        advise_sequential(rf)
+
+        assert rf.read() == b"\x00\x01"
+
+
 def test_close_file(stream: callable):
     path = stream()
 
@@ -208,3 +265,25 @@ def test_write_to_file_none(stream: callable):
     write_to_file(path)
 
     assert path.tell() == ptr
+
+
+def test_write_chunks_to_file(stream: callable):
+    path = stream()
+    write_chunks_to_file(path, [b"4", memoryview(b"2")])
+
+    assert path.getvalue() == b"42"
+
+
+def test_write_chunks_to_file_path(tmp_path):
+    path = tmp_path / "chunks.bin"
+    write_chunks_to_file(path, [b"4", b"2"])
+
+    assert path.read_bytes() == b"42"
+    with pytest.raises(FileExistsError):
+        write_chunks_to_file(path, [b"0"])
+
+
+def test_write_chunks_to_file_wrong_input():
+
+    with pytest.raises(OSError):
+        write_chunks_to_file(1, [b"42"])
@@ -12,11 +12,15 @@
 # IMPORTS
 # ============================================================================
 
+import io
+import os
 import warnings
+from datetime import datetime
 
 from astropy.io import fits as astrofits
 
 from deepspyce import datasets
+from deepspyce.io import raw
 from deepspyce.io.filterbank import (
     check_header_start_end,
     df_to_filterbank,
@@ -24,11 +28,18 @@ from deepspyce.io.filterbank import (
     iar_to_fil_header,
     raw_to_filterbank,
 )
-from deepspyce.io.fits import df_to_fits, make_fits_header, raw_to_fits
+from deepspyce.io.fits import (
+    df_to_fits,
+    fits_to_df,
+    make_fits_header,
+    raw_to_fits,
+)
 from deepspyce.io.iar import read_iar
-from deepspyce.io.raw import raw_to_df
+from deepspyce.io.raw import df_to_raw, iter_raw, raw_to_df, raws_to_dfs
 from deepspyce.utils import files_utils
 
+import numpy as np
+
 import pandas as pd
 
 import pytest
@@ -74,6 +85,82 @@ class TestRaw:
 
         pd.testing.assert_frame_equal(original, result)
 
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_raw_to_df_mmap(
+        self, tmp_path, monkeypatch, df_and_buff: callable, order
+    ):
+        """Test for memory mapped raw file to dataframe conversion."""
+        original, buff_raw = df_and_buff(order=order, seed=42)
+        path = tmp_path / "mock.raw"
+        path.write_bytes(buff_raw.getvalue())
+        mapped = []
+
+        def _memmap_raw(*args):
+            mapped.append(memmap_raw(*args))
+            return mapped[-1]
+
+        memmap_raw = raw._memmap_raw
+        monkeypatch.setattr(raw, "_memmap_raw", _memmap_raw)
+        result = raw_to_df(path, order=order, mmap=True)
+        nommap = raw_to_df(path, order=order)
+
+        assert isinstance(mapped[0], np.memmap)
+        assert np.shares_memory(result.values, mapped[0])
+        pd.testing.assert_frame_equal(original, result)
+        pd.testing.assert_frame_equal(nommap, result)
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_raw_to_df_stream_aligned(self, df_and_buff: callable, order):
+        """Test for reading raw streams into 64-byte aligned arrays."""
+        original, buff_raw = df_and_buff(order=order, seed=42)
+        result = raw_to_df(buff_raw, order=order)
+
+        assert result.values.ctypes.data % 64 == 0
+        pd.testing.assert_frame_equal(original, result)
+
+    @pytest.mark.parametrize("source", ["mmap", "path", "stream", "pipe"])
+    def test_raw_to_df_truncated(self, tmp_path, source: str):
+        """Test for warning on raw files with a trailing partial record."""
+        original = np.arange(12, dtype=">i8").reshape(4, 3, order="F")
+        bin_raw = original.tobytes("F") + b"\x00" * 5
+        path = tmp_path / "mock.raw"
+        path.write_bytes(bin_raw)
+        rawfile = path
+        if source == "stream":
+            rawfile = io.BytesIO(bin_raw)
+        elif source == "pipe":
+            rfd, wfd = os.pipe()
+            with os.fdopen(wfd, "wb") as wf:
+                wf.write(bin_raw)
+            rawfile = os.fdopen(rfd, "rb")
+
+        with pytest.warns(UserWarning, match="5 trailing bytes"):
+            result = raw_to_df(rawfile, n_channels=4, mmap=source == "mmap")
+        if source == "pipe":
+            rawfile.close()
+        np.testing.assert_array_equal(original, result)
+
+    def test_raw_to_df_same_path(self, tmp_path):
+        """Test for reading a raw file and writing it back to its path."""
+        original = np.arange(12, dtype=">i8").reshape(4, 3, order="F")
+        path = tmp_path / "mock.raw"
+        path.write_bytes(original.tobytes("F"))
+        df = raw_to_df(path, n_channels=4)
+        df_to_raw(df, path, overwrite=True)
+
+        assert path.read_bytes() == original.tobytes("F")
+        np.testing.assert_array_equal(original, df)
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_raw_to_df_complex(self, tmp_path, mmap: bool):
+        """Test for reading raw files whose alignment is not the itemsize."""
+        original = np.arange(12, dtype=">c16").reshape(3, 4, order="F")
+        path = tmp_path / "mock.raw"
+        path.write_bytes(original.tobytes("F"))
+        result = raw_to_df(path, n_channels=3, fmt=">c16", mmap=mmap)
+
+        np.testing.assert_array_equal(original, result)
+
     @pytest.mark.parametrize(
         "data", [False, 0, 0.0, [0], (0, 0.0), {0: 0}, bytes(0)]
     )
@@ -89,6 +176,106 @@ class TestRaw:
         with pytest.raises(FileNotFoundError):
             raw_to_df(wrong_path)
 
+    @pytest.mark.parametrize("fmt", [">i8", "<i4"])
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_df_to_raw(self, stream: callable, df_rand, fmt: str, order):
+        """Test for writing a dataframe into a raw file and back."""
+        original = df_rand(fmt=fmt, seed=42)
+        path = stream()
+        df_to_raw(original, path, fmt=fmt, order=order)
+        path.seek(0)
+        result = raw_to_df(path, fmt=fmt, order=order)
+
+        pd.testing.assert_frame_equal(original, result)
+
+    def test_df_to_raw_no_overwrite(self, df_rand: callable):
+        """Test for not overwriting an existing raw file."""
+
+        with pytest.raises(FileExistsError):
+            df_to_raw(df_rand(), rawpath)
+
+    def test_raws_to_dfs(self, df_and_buff: callable):
+        """Test for reading several raw files concurrently."""
+        originals, buffs = zip(
+            *[df_and_buff(order="F", seed=seed) for seed in range(3)]
+        )
+        results = raws_to_dfs(list(buffs) + [rawpath], max_workers=2)
+
+        assert len(results) == 4
+        for original, result in zip(originals, results):
+            pd.testing.assert_frame_equal(original, result)
+        pd.testing.assert_frame_equal(datasets.load_csv_test(), results[-1])
+
+    @pytest.mark.parametrize("chunk_records", [1, 2, 3, 10])
+    def test_iter_raw(self, df_and_buff: callable, chunk_records: int):
+        """Test for iterating mock raw files in chunks of records."""
+        original, buff_raw = df_and_buff(order="F", seed=42)
+        chunks = [
+            chunk.copy()
+            for chunk in iter_raw(buff_raw, chunk_records=chunk_records)
+        ]
+
+        assert all(chunk.shape[1] <= chunk_records for chunk in chunks)
+        np.testing.assert_array_equal(original, np.hstack(chunks))
+
+    def test_iter_raw_template(self):
+        """Test for iterating template raw file in chunks of records."""
+        original = datasets.load_csv_test()
+        chunks = [chunk.copy() for chunk in iter_raw(rawpath, chunk_records=1)]
+
+        assert len(chunks) == 2
+        np.testing.assert_array_equal(original, np.hstack(chunks))
+
+    def test_iter_raw_pipe(self):
+        """Test for iterating raw data from a non seekable pipe."""
+        original = np.arange(12, dtype=">i8").reshape(4, 3, order="F")
+        rfd, wfd = os.pipe()
+        with os.fdopen(wfd, "wb") as wf:
+            wf.write(original.tobytes("F"))
+        with os.fdopen(rfd, "rb") as rf:
+            chunks = [
+                chunk.copy()
+                for chunk in iter_raw(rf, n_channels=4, chunk_records=2)
+            ]
+
+        np.testing.assert_array_equal(original, np.hstack(chunks))
+
+    def test_iter_raw_truncated(self):
+        """Test for warning on raw streams with a trailing partial record."""
+        original = np.arange(12, dtype=">i8").reshape(4, 3, order="F")
+        buff_raw = io.BytesIO(original.tobytes("F") + b"\x00" * 5)
+
+        with pytest.warns(UserWarning, match="5 trailing bytes"):
+            chunks = [
+                chunk.copy()
+                for chunk in iter_raw(buff_raw, n_channels=4, chunk_records=2)
+            ]
+        np.testing.assert_array_equal(original, np.hstack(chunks))
+
+    @pytest.mark.parametrize("order", ["C", "A", None])
+    def test_iter_raw_wrong_order(self, df_and_buff: callable, order: str):
+        """Test for rejecting raw iteration in non Fortran order."""
+        _, buff_raw = df_and_buff(order="C", seed=42)
+
+        with pytest.raises(ValueError):
+            next(iter_raw(buff_raw, order=order))
+        with pytest.raises(ValueError):
+            next(iter_raw(rawpath, order=order))
+
+    def test_iter_raw_order_f(self, df_and_buff: callable):
+        """Test for iterating raw data with explicit Fortran order."""
+        original, buff_raw = df_and_buff(order="F", seed=42)
+        chunks = [chunk.copy() for chunk in iter_raw(buff_raw, order="F")]
+
+        np.testing.assert_array_equal(original, np.hstack(chunks))
+
+    @pytest.mark.parametrize("data", [False, 0, 0.0, [0], (0, 0.0), {0: 0}])
+    def test_iter_raw_wrong_input(self, data: any):
+        """Test for wrong input at raw iteration."""
+
+        with pytest.raises(OSError):
+            next(iter_raw(data))
+
 
 class TestFits:
     def test_make_fits_header_empty(self):
@@ -104,6 +291,15 @@ class TestFits:
         assert isinstance(header, astrofits.header.Header)
         assert header["ORIGIN"] == "IAR"
 
+    def test_make_fits_header_template_not_shared(self):
+        """Test for making independent template headers."""
+        header = make_fits_header(template=True)
+        header["ORIGIN"] = "NOT IAR"
+        other = make_fits_header(template=True)
+
+        assert other["ORIGIN"] == "IAR"
+        assert other["DATE"] == datetime.today().strftime("%y-%m-%d")
+
     def test_make_fits_header_given(self):
         """Test for making template header."""
         hdr = astrofits.Header()
@@ -131,6 +327,27 @@ class TestFits:
 
         assert path.tell() == 89280
 
+    @pytest.mark.parametrize("fmt", [">i8", "<i4", "f8", "u2"])
+    def test_df_to_fits_roundtrip(self, tmp_path, df_rand, fmt: str):
+        """Test for reading back the table written into a .fits file."""
+        df = df_rand(fmt=fmt, top=1_000, seed=42)
+        path = tmp_path / "mock.fits"
+        df_to_fits(df, path)
+
+        with astrofits.open(path) as hdul:
+            table = hdul["SINGLE DISH"].data
+            assert table.columns.names == [f"col{i}" for i in range(5)]
+            for idx in range(5):
+                np.testing.assert_array_equal(table[f"col{idx}"], df[idx])
+
+    def test_df_to_fits_no_verify(self, stream: callable, df_rand: callable):
+        """Test for writing DataFrame into .fits file, without verifying."""
+        df = df_rand()
+        path = stream()
+        df_to_fits(df, path, output_verify="ignore")
+
+        assert path.tell() == 89280
+
     def test_df_to_fits_wrong_path(self, wrong_path: str, df_rand: callable):
         """Test for wrong Dir at fits conversion."""
         df = df_rand()
@@ -148,6 +365,18 @@ class TestFits:
 
         assert path.tell() == 89280
 
+    @pytest.mark.parametrize("fmt", [">i8", "u2"])
+    def test_df_to_fits_header_unchanged(self, tmp_path, df_rand, fmt: str):
+        """Test for leaving the given header untouched, and reusable."""
+        df = df_rand(fmt=fmt, top=1_000)
+        hdr = make_fits_header({"MAGICNUM": 42}, template=True)
+        expected = hdr.copy()
+        df_to_fits(df, tmp_path / "first.fits", header=hdr)
+        df_to_fits(df, tmp_path / "second.fits", header=hdr)
+
+        assert hdr == expected
+        assert "EXTNAME" not in astrofits.getheader(tmp_path / "second.fits")
+
     def test_raw_to_fits(self, stream: callable, df_and_buff: callable):
         """Test for writing raw data into .fits file."""
         path = stream()
@@ -156,6 +385,27 @@ class TestFits:
 
         assert path.tell() == 89280
 
+    def test_fits_to_df(self, stream: callable, df_rand: callable):
+        """Test for reading back a .fits file into a DataFrame."""
+        df = df_rand(seed=42)
+        path = stream()
+        df_to_fits(df, path)
+        path.seek(0)
+        result = fits_to_df(path)
+
+        assert list(result.columns) == [f"col{i}" for i in range(5)]
+        np.testing.assert_array_equal(result, df)
+
+    def test_fits_to_df_columns(self, tmp_path, df_rand: callable):
+        """Test for reading some columns of a .fits file."""
+        df = df_rand(seed=42)
+        path = tmp_path / "mock.fits"
+        df_to_fits(df, path)
+        result = fits_to_df(path, columns=["col3", "col1"])
+
+        assert list(result.columns) == ["col3", "col1"]
+        np.testing.assert_array_equal(result, df[[3, 1]])
+
 
 class TestIar:
     def test_read_iar(self):
@@ -164,6 +414,49 @@ class TestIar:
 
         assert isinstance(iardict, dict)
 
+    def test_read_iar_cached(self, tmp_path):
+        """Test for re-reading a cached .iar file only when modified."""
+        path = tmp_path / "mock.iar"
+        path.write_text("Source Name,A\n")
+        first = read_iar(path)
+        first["Source Name"] = "B"
+
+        assert read_iar(path) == {"Source Name": "A"}
+        path.write_text("Source Name,C\n")
+        os.utime(path, ns=(0, 0))
+        assert read_iar(path) == {"Source Name": "C"}
+        path.write_text("Source Name,DD\n")
+        os.utime(path, ns=(0, 0))
+        assert read_iar(path) == {"Source Name": "DD"}
+
+    def test_read_iar_cached_relative(self, tmp_path, monkeypatch):
+        """Test for caching relative .iar paths by their absolute path."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "mock.iar").write_text(f"Source Name,{name}\n")
+            os.utime(tmp_path / name / "mock.iar", ns=(0, 0))
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert read_iar("mock.iar") == {"Source Name": "a"}
+        monkeypatch.chdir(tmp_path / "b")
+        assert read_iar("mock.iar") == {"Source Name": "b"}
+
+    def test_read_iar_types(self):
+        """Test for casting .iar values with the known key types."""
+        iarstream = io.StringIO("Source Name,1810\nGain (dB),30\nFoo,bar\n")
+        iardict = read_iar(iarstream)
+
+        expected = {"Source Name": "1810", "Gain (dB)": 30.0, "Foo": "bar"}
+
+        assert iardict == expected
+
+    def test_read_iar_value_comma(self):
+        """Test for keeping commas inside .iar values."""
+        iarstream = io.StringIO("Source Name,J0437,4715\n\nCal,0\n")
+        iardict = read_iar(iarstream)
+
+        assert iardict == {"Source Name": "J0437,4715", "Cal": 0.0}
+
 
 class TestFilterbank:
     def test_check_header_start_end(self):
@@ -190,6 +483,19 @@ class TestFilterbank:
             assert check_header_start_end(wrong, True) == (False, False)
             assert check_header_start_end(terrible, True) == (False, False)
 
+    def test_check_header_start_end_single_warning(self):
+        """Test for reporting all header issues in a single warning."""
+        terrible = dict(
+            {"HEADER_END": "NO", "HEADER_START": True, "MAGIC_NUMBER": 42}
+        )
+
+        with pytest.warns(UserWarning) as record:
+            check_header_start_end(terrible, True)
+
+        assert len(record) == 1
+        assert "HEADER_START" in str(record[0].message)
+        assert "HEADER_END" in str(record[0].message)
+
     def test_fixed_header_start_end(self):
         """Test for fixing HEADER_START and HEADER_END."""
         bad = dict()
@@ -250,6 +556,26 @@ class TestFilterbank:
 
         assert outf.tell() == 81950
 
+    def test_df_to_filterbank_no_rawdatafile(
+        self, stream: callable, df_rand: callable
+    ):
+        """Test for building .fil without rawdatafile, warning free."""
+        df = df_rand()
+        outf = stream()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            df_to_filterbank(df, outfile=outf)
+
+        assert outf.tell() == 81950
+
+    def test_df_to_filterbank_name_mismatch(self, tmp_path, df_rand: callable):
+        """Test for warning when rawdatafile and file name differ."""
+        df = df_rand()
+        header = dict({"rawdatafile": "other.fil"})
+
+        with pytest.warns(UserWarning, match="do not match"):
+            df_to_filterbank(df, header, tmp_path / "mock.fil")
+
     def test_df_to_filterbank_no_output(self, df_rand: callable):
         """Test for building .fil from dataframe, without output."""
         df = df_rand()